@@ -27,6 +27,10 @@ if PY2:  # pragma: nocover-py3
     def viewkeys(d):
         return d.viewkeys()
 
+    def mappingproxy(d):
+        # Python 2 has no read-only dict view, so fall back to the dict itself.
+        return d
+
     def unwrap(func, stop=None):
         # NOTE: implementation is taken from CPython/Lib/inspect.py, Python 3.6
         if stop is None:
@@ -53,6 +57,7 @@ if PY2:  # pragma: nocover-py3
 else:  # pragma: nocover-py2
     from inspect import signature, Parameter, unwrap
     from itertools import zip_longest
+    from types import MappingProxyType as mappingproxy
 
     wraps = functools.wraps
 
@@ -79,6 +84,7 @@ __all__ = [
     "PY2",
     "PY3",
     "Parameter",
+    "mappingproxy",
     "raise_from",
     "signature",
     "unwrap",
@@ -6,10 +6,15 @@ Functional programming utilities.
 from collections import deque
 from operator import itemgetter
 
-from .compat import viewkeys
-
 
 def complement(f):
+    """
+    Return a function that negates the result of ``f``.
+
+    This adds a layer of ``*args/**kwargs`` forwarding to every call, so
+    prefer an explicit predicate in performance-sensitive code.
+    """
+
     def not_f(*args, **kwargs):
         return not f(*args, **kwargs)
 
@@ -29,7 +34,10 @@ def valfilter(f, d):
 
 
 def dzip(left, right):
-    return {k: (left.get(k), right.get(k)) for k in viewkeys(left) & viewkeys(right)}
+    # Iterate over the smaller dict, probing the larger one.
+    if len(left) <= len(right):
+        return {k: (left[k], right[k]) for k in left if k in right}
+    return {k: (left[k], right[k]) for k in right if k in left}
 
 
 def sliding_window(iterable, n):
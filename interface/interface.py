@@ -1,17 +1,15 @@
-from collections import defaultdict
-from operator import attrgetter, itemgetter
+from collections import OrderedDict
+from operator import attrgetter
 from textwrap import dedent
 from weakref import WeakKeyDictionary
 
-from .compat import raise_from, with_metaclass
+from .compat import mappingproxy, raise_from, with_metaclass
 from .default import default, warn_if_defaults_use_non_interface_members
 from .formatting import bulleted_list
-from .functional import complement, keyfilter, merge, valfilter
+from .functional import merge
 from .typecheck import compatible
-from .typed_signature import TypedSignature
-from .utils import is_a, unique
+from .typed_signature import extract_func, TypedSignature
 
-first = itemgetter(0)
 getname = attrgetter("__name__")
 
 
@@ -39,16 +37,55 @@ CLASS_ATTRIBUTE_WHITELIST = frozenset(
     ]
 )
 
-is_interface_field_name = complement(CLASS_ATTRIBUTE_WHITELIST.__contains__)
-
 TRIVIAL_CLASS_ATTRIBUTES = frozenset(dir(type("_", (object,), {})))
 
+_CONFLICTING_DEFAULTS_TEMPLATE = dedent(
+    """
+
+    The following interfaces provided default implementations for {attr!r}:
+    {interfaces}"""
+)
+
+_MISSING_METHODS_TEMPLATE = dedent(
+    """
+
+    The following methods of {I} were not implemented:
+    {missing_methods}"""
+)
+
+_MISTYPED_METHODS_TEMPLATE = dedent(
+    """
+
+    The following methods of {I} were implemented with incorrect types:
+    {mismatched_types}"""
+)
+
+_MISMATCHED_METHODS_TEMPLATE = dedent(
+    """
+
+    The following methods of {I} were implemented with invalid signatures:
+    {mismatched_methods}"""
+)
+
+_IMPLEMENTS_DOC_TEMPLATE = dedent(
+    """\
+    Implementation of {interfaces}.
+
+    Methods
+    -------
+    {methods}"""
+)
+
+
+# Sentinel for attributes that aren't present.
+_MISSING = object()
+
 
 def static_get_type_attr(t, name):
     """
     Get a type attribute statically, circumventing the descriptor protocol.
     """
-    for type_ in t.mro():
+    for type_ in t.__mro__:
         try:
             return vars(type_)[name]
         except KeyError:
@@ -56,6 +93,94 @@ def static_get_type_attr(t, name):
     raise AttributeError(name)
 
 
+def _static_get_type_attrs(t, names):
+    """
+    Get several type attributes statically in a single pass over ``t.__mro__``.
+
+    Returns a dict mapping each name in ``names`` that was found to its
+    attribute. Names that weren't found are omitted.
+    """
+    out = {}
+    wanted = set(names)
+    for type_ in t.__mro__:
+        if not wanted:
+            break
+        d = vars(type_)
+        found = wanted.intersection(d)
+        for name in found:
+            out[name] = d[name]
+        wanted -= found
+    return out
+
+
+# Cache of TypedSignatures, keyed by the object from which they were built.
+#
+# The same function objects recur across many implementations (via mixins and
+# inherited methods), so we avoid re-parsing their signatures.
+_SIG_CACHE = WeakKeyDictionary()
+
+# staticmethod, classmethod, and property objects can't be weakly referenced,
+# so their signatures are cached by the function they wrap instead, as a map
+# from function -> {descriptor type -> TypedSignature}.
+_WRAPPED_SIG_CACHE = WeakKeyDictionary()
+
+
+def _cached_typed_signature(f):
+    """
+    Get a TypedSignature for ``f``, reusing a previously-constructed one if
+    possible.
+    """
+    try:
+        return _SIG_CACHE[f]
+    except KeyError:
+        pass
+    except TypeError:
+        # f isn't weakly-referenceable or isn't hashable.
+        return _cached_wrapped_typed_signature(f)
+
+    sig = _SIG_CACHE[f] = TypedSignature(f)
+    return sig
+
+
+def _cached_wrapped_typed_signature(f):
+    """
+    Get a TypedSignature for ``f``, caching it by the function ``f`` wraps.
+    """
+    try:
+        by_type = _WRAPPED_SIG_CACHE.setdefault(extract_func(f), {})
+    except TypeError:
+        # The wrapped object can't be weakly referenced either.
+        return TypedSignature(f)
+
+    try:
+        return by_type[type(f)]
+    except KeyError:
+        sig = by_type[type(f)] = TypedSignature(f)
+        return sig
+
+
+# Cache of results of ``compatible``, as a map from
+# impl_sig -> {iface_sig -> result}. Both levels are weak, so entries go away
+# with the signatures they describe, including ones that weren't cached by
+# ``_cached_typed_signature``.
+_COMPATIBLE_CACHE = WeakKeyDictionary()
+
+
+def _compatible_cached(impl_sig, iface_sig):
+    """
+    Memoized version of ``compatible``.
+    """
+    by_iface = _COMPATIBLE_CACHE.get(impl_sig)
+    if by_iface is None:
+        by_iface = _COMPATIBLE_CACHE[impl_sig] = WeakKeyDictionary()
+
+    try:
+        return by_iface[iface_sig]
+    except KeyError:
+        result = by_iface[iface_sig] = compatible(impl_sig, iface_sig)
+        return result
+
+
 def _conflicting_defaults(typename, conflicts):
     """Format an error message for conflicting default implementations.
 
@@ -75,12 +200,7 @@ def _conflicting_defaults(typename, conflicts):
         C=typename,
     )
     for attrname, interfaces in conflicts.items():
-        message += dedent(
-            """
-
-            The following interfaces provided default implementations for {attr!r}:
-            {interfaces}"""
-        ).format(
+        message += _CONFLICTING_DEFAULTS_TEMPLATE.format(
             attr=attrname,
             interfaces=bulleted_list(sorted(map(getname, interfaces))),
         )
@@ -107,23 +227,27 @@ class InterfaceMeta(type):
         defaults = _merge_parent_defaults(bases)
         ignored = clsdict.get("_INTERFACE_IGNORE_MEMBERS", set())
 
-        for field, v in keyfilter(is_interface_field_name, clsdict).items():
-            if field in ignored:
-                continue
-
-            try:
-                signature = TypedSignature(v)
-            except TypeError as e:
-                errmsg = (
-                    "Couldn't parse signature for field "
-                    "{iface_name}.{fieldname} of type {attrtype}.".format(
-                        iface_name=name,
-                        fieldname=field,
-                        attrtype=getname(type(v)),
-                    )
+        # Parse all signatures up front, so that we only pay for one ``try``
+        # block per class. On failure, ``field`` and ``v`` are the entry that
+        # couldn't be parsed.
+        parsed = []
+        try:
+            for field, v in clsdict.items():
+                if field in CLASS_ATTRIBUTE_WHITELIST or field in ignored:
+                    continue
+                parsed.append((field, v, _cached_typed_signature(v)))
+        except TypeError as e:
+            errmsg = (
+                "Couldn't parse signature for field "
+                "{iface_name}.{fieldname} of type {attrtype}.".format(
+                    iface_name=name,
+                    fieldname=field,
+                    attrtype=getname(type(v)),
                 )
-                raise_from(TypeError(errmsg), e)
+            )
+            raise_from(TypeError(errmsg), e)
 
+        for field, v, signature in parsed:
             # If we already have a signature for this field from a parent, then
             # our new signature must be a subtype of the parent signature, so
             # that any valid call to the new signature must also be a valid
@@ -150,7 +274,9 @@ class InterfaceMeta(type):
             name, defaults, set(signatures.keys())
         )
 
-        clsdict["_signatures"] = signatures
+        clsdict["_signatures"] = mappingproxy(signatures)
+        clsdict["_signatures_items"] = tuple(signatures.items())
+        clsdict["_signatures_sorted_names"] = tuple(sorted(signatures))
         clsdict["_defaults"] = defaults
         return super(InterfaceMeta, mcls).__new__(mcls, name, bases, clsdict)
 
@@ -173,22 +299,28 @@ class InterfaceMeta(type):
         missing = []
         mistyped = {}
         mismatched = {}
-        for name, iface_sig in self._signatures.items():
+        # Don't invoke the descriptor protocol here so that we get
+        # staticmethod/classmethod/property objects instead of the functions
+        # they wrap.
+        attrs = _static_get_type_attrs(type_, self._signatures)
+        own_attrs = vars(self)
+        for name, iface_sig in self._signatures_items:
             try:
-                # Don't invoke the descriptor protocol here so that we get
-                # staticmethod/classmethod/property objects instead of the
-                # functions they wrap.
-                f = static_get_type_attr(type_, name)
-            except AttributeError:
+                f = attrs[name]
+            except KeyError:
                 missing.append(name)
                 continue
 
-            impl_sig = TypedSignature(f)
+            if f is own_attrs.get(name, _MISSING):
+                # type_ is using our own definition, which trivially matches.
+                continue
+
+            impl_sig = _cached_typed_signature(f)
 
             if not issubclass(impl_sig.type, iface_sig.type):
                 mistyped[name] = impl_sig.type
 
-            if not compatible(impl_sig, iface_sig):
+            if not _compatible_cached(impl_sig, iface_sig):
                 mismatched[name] = impl_sig
 
         return missing, mistyped, mismatched
@@ -209,7 +341,9 @@ class InterfaceMeta(type):
 
         Returns
         -------
-        None
+        defaults : dict[str -> object]
+            Default implementations that should be used for methods not
+            provided by ``type_``.
         """
         raw_missing, mistyped, mismatched = self._diff_signatures(type_)
 
@@ -233,51 +367,37 @@ class InterfaceMeta(type):
         """
         assert missing or mistyped or mismatched, "Implementation wasn't invalid."
 
+        iface_name = self.__name__
         message = "\nclass {C} failed to implement interface {I}:".format(
-            C=getname(t),
-            I=getname(self),
+            C=t.__name__,
+            I=iface_name,
         )
         if missing:
-            message += dedent(
-                """
-
-                The following methods of {I} were not implemented:
-                {missing_methods}"""
-            ).format(
-                I=getname(self), missing_methods=self._format_missing_methods(missing)
+            message += _MISSING_METHODS_TEMPLATE.format(
+                I=iface_name, missing_methods=self._format_missing_methods(missing)
             )
 
         if mistyped:
-            message += dedent(
-                """
-
-                The following methods of {I} were implemented with incorrect types:
-                {mismatched_types}"""
-            ).format(
-                I=getname(self),
+            message += _MISTYPED_METHODS_TEMPLATE.format(
+                I=iface_name,
                 mismatched_types=self._format_mismatched_types(mistyped),
             )
 
         if mismatched:
-            message += dedent(
-                """
-
-                The following methods of {I} were implemented with invalid signatures:
-                {mismatched_methods}"""
-            ).format(
-                I=getname(self),
+            message += _MISMATCHED_METHODS_TEMPLATE.format(
+                I=iface_name,
                 mismatched_methods=self._format_mismatched_methods(mismatched),
             )
         return InvalidImplementation(message)
 
     def _format_missing_methods(self, missing):
+        missing_set = frozenset(missing)
         return "\n".join(
-            sorted(
-                [
-                    "  - {name}{sig}".format(name=name, sig=self._signatures[name])
-                    for name in missing
-                ]
-            )
+            [
+                "  - {name}{sig}".format(name=name, sig=self._signatures[name])
+                for name in self._signatures_sorted_names
+                if name in missing_set
+            ]
         )
 
     def _format_mismatched_types(self, mistyped):
@@ -287,8 +407,8 @@ class InterfaceMeta(type):
                     "  - {name}: {actual!r} is not a subtype "
                     "of expected type {expected!r}".format(
                         name=name,
-                        actual=getname(bad_type),
-                        expected=getname(self._signatures[name].type),
+                        actual=bad_type.__name__,
+                        expected=self._signatures[name].type.__name__,
                     )
                     for name, bad_type in mistyped.items()
                 ]
@@ -422,30 +542,42 @@ class ImplementsMeta(type):
     def __new__(mcls, name, bases, clsdict, interfaces=empty_set):
         assert isinstance(interfaces, frozenset)
 
+        clsdict["_interfaces"] = interfaces
         newtype = super(ImplementsMeta, mcls).__new__(mcls, name, bases, clsdict)
 
+        # Interfaces and the MRO are fixed at class creation, so resolve the
+        # full set of implemented interfaces once up front.
+        newtype._interfaces_resolved = tuple(
+            OrderedDict.fromkeys(newtype._interfaces_with_duplicates())
+        )
+
         if interfaces:
             # Don't do checks on the types returned by ``implements``.
             return newtype
 
         errors = []
         default_impls = {}
-        default_providers = defaultdict(list)
+        # The first interface to provide a default for each name.
+        default_providers = {}
+        # The list of providers for each name with more than one provider.
+        conflicts = {}
         for iface in sorted(newtype.interfaces(), key=getname):
             try:
                 defaults_from_iface = iface.verify(newtype)
                 for name, impl in defaults_from_iface.items():
                     default_impls[name] = impl
-                    default_providers[name].append(iface)
+                    prev = default_providers.setdefault(name, iface)
+                    if prev is not iface:
+                        conflicts.setdefault(name, [prev]).append(iface)
             except InvalidImplementation as e:
                 errors.append(e)
 
-        # The list of providers for `name`, if there's more than one.
-        duplicate_defaults = valfilter(
-            lambda ifaces: len(ifaces) > 1, default_providers
-        )
-        if duplicate_defaults:
-            errors.append(_conflicting_defaults(newtype.__name__, duplicate_defaults))
+        if conflicts:
+            # Report conflicts in the order their names were first provided.
+            conflicts = {
+                name: conflicts[name] for name in default_providers if name in conflicts
+            }
+            errors.append(_conflicting_defaults(newtype.__name__, conflicts))
         else:
             for name, impl in default_impls.items():
                 setattr(newtype, name, impl)
@@ -458,20 +590,16 @@ class ImplementsMeta(type):
             raise InvalidImplementation("\n".join(map(str, errors)))
 
     def __init__(mcls, name, bases, clsdict, interfaces=empty_set):
-        mcls._interfaces = interfaces
         super(ImplementsMeta, mcls).__init__(name, bases, clsdict)
 
     def interfaces(self):
-        for elem in unique(self._interfaces_with_duplicates()):
-            yield elem
+        return iter(self._interfaces_resolved)
 
     def _interfaces_with_duplicates(self):
-        for elem in self._interfaces:
-            yield elem
-
-        for t in filter(is_a(ImplementsMeta), self.mro()):
-            for elem in t._interfaces:
-                yield elem
+        for t in self.__mro__:
+            if isinstance(t, ImplementsMeta):
+                for elem in t._interfaces:
+                    yield elem
 
 
 def format_iface_method_docs(I):
@@ -481,15 +609,18 @@ def format_iface_method_docs(I):
             "{iface_name}.{method_name}{sig}".format(
                 iface_name=iface_name,
                 method_name=method_name,
-                sig=sig,
+                sig=I._signatures[method_name],
             )
-            for method_name, sig in sorted(list(I._signatures.items()), key=first)
+            for method_name in I._signatures_sorted_names
         ]
     )
 
 
 def _make_implements():
     _memo = WeakKeyDictionary()
+    # Map from the exact arguments passed to ``implements`` to its result. This
+    # lets repeated calls skip building a frozenset.
+    _memo_by_args = {}
 
     def implements(*interfaces):
         """
@@ -548,9 +679,16 @@ def _make_implements():
         if not interfaces:
             raise TypeError("implements() requires at least one interface")
 
+        try:
+            return _memo_by_args[interfaces]
+        except KeyError:
+            pass
+
+        args = interfaces
         interfaces = frozenset(interfaces)
         try:
-            return _memo[interfaces]
+            result = _memo_by_args[args] = _memo[interfaces]
+            return result
         except KeyError:
             pass
 
@@ -558,18 +696,11 @@ def _make_implements():
             if not issubclass(I, Interface):
                 raise TypeError("implements() expected an Interface, but got %s." % I)
 
-        ordered_ifaces = tuple(sorted(interfaces, key=getname))
-        iface_names = list(map(getname, ordered_ifaces))
+        ordered_ifaces = sorted(interfaces, key=getname)
+        iface_names = [I.__name__ for I in ordered_ifaces]
 
         name = "Implements{}".format("_".join(iface_names))
-        doc = dedent(
-            """\
-            Implementation of {interfaces}.
-
-            Methods
-            -------
-            {methods}"""
-        ).format(
+        doc = _IMPLEMENTS_DOC_TEMPLATE.format(
             interfaces=", ".join(iface_names),
             methods="\n".join(map(format_iface_method_docs, ordered_ifaces)),
         )
@@ -585,7 +716,7 @@ def _make_implements():
         # stored somewhere on the resulting type.
         assert result._interfaces is interfaces, "Interfaces not stored."
 
-        _memo[interfaces] = result
+        _memo[interfaces] = _memo_by_args[args] = result
         return result
 
     return implements
@@ -2,7 +2,7 @@ from functools import total_ordering
 
 import pytest
 
-from ..functional import keysorted, sliding_window
+from ..functional import complement, dzip, keyfilter, keysorted, sliding_window
 
 
 def test_sliding_window():
@@ -12,6 +12,25 @@ def test_sliding_window():
     assert list(sliding_window([1, 2, 3, 4], 3)) == [(1, 2, 3), (2, 3, 4)]
 
 
+def test_complement():
+    is_odd = complement(lambda x: x % 2 == 0)
+    assert is_odd(1)
+    assert not is_odd(2)
+
+
+def test_dzip():
+    assert dzip({}, {"a": 1}) == {}
+    assert dzip({"a": 1, "b": 2}, {"b": 3}) == {"b": (2, 3)}
+    assert dzip({"b": 3}, {"a": 1, "b": 2}) == {"b": (3, 2)}
+    assert dzip({"a": 1, "b": 2}, {"a": 3, "b": 4}) == {"a": (1, 3), "b": (2, 4)}
+
+
+def test_keyfilter():
+    d = {"a": 1, "b": 2, "c": 3}
+    assert keyfilter(lambda k: k != "b", d) == {"a": 1, "c": 3}
+    assert keyfilter(lambda k: False, d) == {}
+
+
 def test_keysorted():
     @total_ordering
     class Unorderable(object):
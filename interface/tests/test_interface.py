@@ -1,4 +1,7 @@
+import gc
+import sys
 from textwrap import dedent
+import weakref
 
 import pytest
 
@@ -250,6 +253,8 @@ def test_implements_memoization():
 
     assert implements(I) is implements(I)
     assert implements(I) is not implements(OtherI)
+    assert implements(I, OtherI) is implements(OtherI, I)
+    assert implements(I, I) is implements(I)
 
 
 def test_reject_invalid_interface():
@@ -605,6 +610,48 @@ def test_conflicting_defaults():
     assert actual == expected
 
 
+@pytest.mark.skipif(sys.version_info < (3, 6), reason="Requires ordered dicts")
+def test_conflicting_defaults_order():
+    class A(Interface):  # pragma: nocover
+        @default
+        def x(self):
+            pass
+
+        @default
+        def y(self):
+            pass
+
+    class B(Interface):  # pragma: nocover
+        @default
+        def y(self):
+            pass
+
+    class C(Interface):  # pragma: nocover
+        @default
+        def x(self):
+            pass
+
+    with pytest.raises(InvalidImplementation) as e:
+
+        class Impl(implements(A, B, C)):  # pragma: nocover
+            pass
+
+    actual = str(e.value)
+    expected = dedent(
+        """
+        class Impl received conflicting default implementations:
+
+        The following interfaces provided default implementations for 'x':
+          - A
+          - C
+
+        The following interfaces provided default implementations for 'y':
+          - A
+          - B"""
+    )
+    assert actual == expected
+
+
 def test_default_repr():
     @default
     def foo(a, b):  # pragma: nocover
@@ -811,6 +858,15 @@ def test_interface_from_class_method_subset():
     assert actual_message == expected_message
 
 
+def test_interface_from_class_missing_subset_attribute():
+    class C(object):  # pragma: nocover
+        def method1(self, x):
+            pass
+
+    with pytest.raises(AttributeError):
+        Interface.from_class(C, subset=["method1", "method2"])
+
+
 def test_interface_from_class_inherited_methods():
     class Base(object):  # pragma: nocover
         def base_method(self, x):
@@ -1012,3 +1068,248 @@ def test_subclass_allow_compatible_extension():
     class C2(B):  # pragma: nocover
         def method_b(self, y, z=None):
             pass
+
+
+def test_descriptor_signatures():
+    def f(x):  # pragma: nocover
+        pass
+
+    class I(Interface):
+        s = staticmethod(f)
+
+    # The same function wrapped in the same kind of descriptor is fine.
+    class C(implements(I)):
+        s = staticmethod(f)
+
+    # Wrapped in a different kind of descriptor, it has the wrong type.
+    with pytest.raises(InvalidImplementation) as e:
+
+        class D(implements(I)):
+            s = classmethod(f)
+
+    assert "  - s: 'classmethod' is not a subtype of expected type 'staticmethod'" in (
+        str(e.value)
+    )
+
+    # Descriptors wrapping objects that can't be weakly referenced still work.
+    class NoWeakrefs(object):
+        __slots__ = ()
+
+        def __call__(self, x):  # pragma: nocover
+            pass
+
+    class J(Interface):
+        s = staticmethod(NoWeakrefs())
+
+    class E(implements(J)):
+        s = staticmethod(NoWeakrefs())
+
+    with pytest.raises(InvalidImplementation):
+
+        class F(implements(J)):
+            @staticmethod
+            def s(x, y):  # pragma: nocover
+                pass
+
+
+def test_implementations_can_be_garbage_collected():
+    class I(Interface):  # pragma: nocover
+        def m(self, x):
+            pass
+
+        @staticmethod
+        def s(x):
+            pass
+
+        @property
+        def p(self):
+            pass
+
+    def make_implementation():
+        class C(implements(I)):  # pragma: nocover
+            def m(self, x):
+                pass
+
+            @staticmethod
+            def s(x):
+                pass
+
+            @property
+            def p(self):
+                pass
+
+        I.verify(C)
+        return [
+            weakref.ref(C),
+            weakref.ref(vars(C)["m"]),
+            weakref.ref(vars(C)["s"].__func__),
+            weakref.ref(vars(C)["p"].fget),
+        ]
+
+    refs = make_implementation()
+    gc.collect()
+    assert [r() for r in refs] == [None] * len(refs)
+
+
+def test_verify_reflects_changes_to_type():
+    class I(Interface):  # pragma: nocover
+        def m(self, x):
+            pass
+
+        @default
+        def d(self):
+            pass
+
+    class C(object):
+        pass
+
+    with pytest.raises(InvalidImplementation):
+        I.verify(C)
+
+    def m(self, x):  # pragma: nocover
+        pass
+
+    C.m = m
+    assert I.verify(C) == {"d": I._defaults["d"].implementation}
+
+    def d(self):  # pragma: nocover
+        pass
+
+    C.d = d
+    assert I.verify(C) == {}
+
+
+def test_verify_sees_changes_to_classes():
+    class I(Interface):  # pragma: nocover
+        def m(self):
+            pass
+
+    def m(self):  # pragma: nocover
+        pass
+
+    class Plain(object):
+        pass
+
+    with pytest.raises(InvalidImplementation):
+        I.verify(Plain)
+
+    Plain.m = m
+    assert I.verify(Plain) == {}
+
+    class Mixin(object):
+        pass
+
+    Mixin.m = m
+
+    class C(Mixin, implements(I)):
+        pass
+
+    assert I.verify(C) == {}
+
+    del Mixin.m
+    with pytest.raises(InvalidImplementation):
+        I.verify(C)
+
+
+def test_verify_uses_most_derived_attributes():
+    class I(Interface):  # pragma: nocover
+        def a(self):
+            pass
+
+        def shadowed(self, x):
+            pass
+
+        def missing(self):
+            pass
+
+    class A(object):  # pragma: nocover
+        def a(self):
+            pass
+
+        def shadowed(self):
+            pass
+
+    class B(A):  # pragma: nocover
+        def shadowed(self, x):
+            pass
+
+    with pytest.raises(InvalidImplementation) as e:
+        I.verify(B)
+
+    actual = str(e.value)
+    expected = dedent(
+        """
+        class B failed to implement interface I:
+
+        The following methods of I were not implemented:
+          - missing(self)"""
+    )
+    assert actual == expected
+
+
+def test_shared_method_checked_against_each_interface():
+    class I1(Interface):  # pragma: nocover
+        def m(self, x):
+            pass
+
+    class I2(Interface):  # pragma: nocover
+        def m(self, x, y):
+            pass
+
+    def m(self, x):  # pragma: nocover
+        pass
+
+    class C(object):
+        pass
+
+    C.m = m
+
+    # Repeated checks of the same method give the same answer for each
+    # interface.
+    for _ in range(2):
+        assert I1.verify(C) == {}
+        with pytest.raises(InvalidImplementation) as e:
+            I2.verify(C)
+        assert "  - m(self, x) != m(self, x, y)" in str(e.value)
+
+
+def test_verify_against_own_definitions():
+    class I(Interface):  # pragma: nocover
+        def m(self, x):
+            pass
+
+        @staticmethod
+        def s(x):
+            pass
+
+        @property
+        def p(self):
+            pass
+
+    assert I.verify(I) == {}
+
+    class C(object):  # pragma: nocover
+        m = vars(I)["m"]
+        s = vars(I)["s"]
+
+        def p(self):
+            pass
+
+    with pytest.raises(InvalidImplementation) as e:
+        I.verify(C)
+    assert "incorrect types" in str(e.value)
+    assert "  - p: 'function' is not a subtype of expected type 'property'" in str(
+        e.value
+    )
+
+
+@py3_only
+def test_signatures_are_read_only():
+    class I(Interface):  # pragma: nocover
+        def m(self, x):
+            pass
+
+    with pytest.raises(TypeError):
+        I._signatures["m"] = None
+
+    assert I._signatures_items == (("m", I._signatures["m"]),)
@@ -4,7 +4,7 @@ Utilities for typed interfaces.
 from itertools import starmap, takewhile
 
 from .compat import Parameter, zip_longest
-from .functional import complement, dzip, valfilter
+from .functional import dzip, valfilter
 
 
 def compatible(impl_sig, iface_sig):
@@ -47,8 +47,8 @@ def compatible(impl_sig, iface_sig):
                 takewhile(is_positional, iface_sig.parameters.values()),
             ),
             keywords_compatible(
-                valfilter(complement(is_positional), impl_sig.parameters),
-                valfilter(complement(is_positional), iface_sig.parameters),
+                valfilter(is_not_positional, impl_sig.parameters),
+                valfilter(is_not_positional, iface_sig.parameters),
             ),
         ]
     )
@@ -61,6 +61,10 @@ def is_positional(arg):
     return arg.kind in _POSITIONALS
 
 
+def is_not_positional(arg):
+    return arg.kind not in _POSITIONALS
+
+
 def has_default(arg):
     """
     Does ``arg`` provide a default?